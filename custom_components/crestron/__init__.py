@@ -2,18 +2,11 @@
 from __future__ import annotations
 
 import asyncio
-from datetime import timedelta
-from typing import Any, Dict
-import logging
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import (
-    CONF_HOST,
-    CONF_SCAN_INTERVAL,
-    Platform,
-)
+from homeassistant.const import CONF_HOST, Platform
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import (
@@ -26,8 +19,8 @@ from .const import (
     ATTR_POSITION,
     ATTR_SHADE_ID,
     CONF_AUTH_TOKEN,
+    CONF_HUB_ID,
     CONF_PORT,
-    DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     MANUFACTURER,
     SERVICE_CLOSE_SHADE,
@@ -35,6 +28,7 @@ from .const import (
     SERVICE_SET_POSITION,
     SERVICE_STOP_SHADE,
     _LOGGER,
+    host_unique_id,
 )
 
 PLATFORMS = [Platform.COVER]
@@ -152,7 +146,6 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         import aiohttp
         from .api import CrestronAPI, ApiAuthError, ApiError
         from .coordinator import CrestronCoordinator
-        from homeassistant.helpers.update_coordinator import UpdateFailed
 
         # Create API client
         api = CrestronAPI(
@@ -161,13 +154,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             auth_token=auth_token,
         )
 
-        # Verify that we can connect
+        # Verify that we can connect while logging in, so the first refresh
+        # reuses the auth key instead of paying for the login round trip
         try:
-            await api.ping()
-        except ApiAuthError as err:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(api.ping())
+                tg.create_task(api.login())
+        except* ApiAuthError as eg:
+            err = eg.exceptions[0]
             _LOGGER.error("Authentication failed: %s", err)
             raise ConfigEntryAuthFailed("Authentication failed") from err
-        except (ApiError, asyncio.TimeoutError, aiohttp.ClientError) as err:
+        except* (ApiError, asyncio.TimeoutError, aiohttp.ClientError) as eg:
+            err = eg.exceptions[0]
             _LOGGER.error("Failed to connect to %s: %s", host, err)
             raise ConfigEntryNotReady(f"Failed to connect to {host}") from err
 
@@ -176,22 +174,24 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
         # Get port if available and build consistent hub identifier
         port = entry.data.get(CONF_PORT, "")
-        hub_id = f"crestron_{host}"
+        hub_id = host_unique_id(host)
         if port:
-            hub_id = f"crestron_{host}:{port}"
-
-        # Check for existing hub device with our format
-        existing_hub_id = None
-        for device in device_registry.devices.values():
-            if any(identifier[0] == DOMAIN and
-                   (identifier[1] == hub_id or
-                    identifier[1].startswith(f"crestron_{host}"))
-                   for identifier in device.identifiers):
-                # Found existing hub with correct format
-                existing_hub_id = next(identifier[1] for identifier in device.identifiers
-                                     if identifier[0] == DOMAIN)
-                _LOGGER.debug("Found existing hub device with ID: %s", existing_hub_id)
-                break
+            hub_id = host_unique_id(f"{host}:{port}")
+
+        # The cover platform persists the resolved hub ID on the entry, so
+        # the device registry only has to be scanned before that happens
+        existing_hub_id = entry.data.get(CONF_HUB_ID)
+        if existing_hub_id is None:
+            for device in device_registry.devices.values():
+                if any(identifier[0] == DOMAIN and
+                       (identifier[1] == hub_id or
+                        identifier[1].startswith(host_unique_id(host)))
+                       for identifier in device.identifiers):
+                    # Found existing hub with correct format
+                    existing_hub_id = next(identifier[1] for identifier in device.identifiers
+                                         if identifier[0] == DOMAIN)
+                    _LOGGER.debug("Found existing hub device with ID: %s", existing_hub_id)
+                    break
 
         # If no existing hub found, use the consistent format
         if not existing_hub_id:
@@ -226,6 +226,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         if len(hass.data[DOMAIN]) == 1:  # First entry
             register_services(hass)
 
+        # Options are read when the coordinator is created; reload to apply changes
+        entry.async_on_unload(entry.add_update_listener(async_update_options))
+
         return True
 
     except Exception as err:
@@ -233,6 +236,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(f"Error setting up Crestron integration: {err}") from err
 
 
+async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry when its options change."""
+    # Data updates (e.g. the persisted hub ID) also call this; ignore those
+    coordinator = hass.data[DOMAIN].get(entry.entry_id)
+    if coordinator is not None and coordinator.options == dict(entry.options):
+        return
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
@@ -1,16 +1,22 @@
 """Crestron API client."""
 from __future__ import annotations
 
+import json
 import logging
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional
 import aiohttp
 import asyncio
-import time
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api_errors import ApiAuthError, ApiConnectionError, ApiError, ApiTimeoutError
+from .api_errors import (
+    ApiAuthError,
+    ApiConnectionError,
+    ApiError,
+    ApiTimeoutError,
+    UnsupportedFeatureError,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +29,12 @@ CLOSED_VALUE = 0    # Full closed position in Crestron
 HA_OPEN_VALUE = 100 # Full open position in Home Assistant
 HA_CLOSED_VALUE = 0 # Full closed position in Home Assistant
 
+# Shade responses larger than this (bytes) are parsed in the executor
+EXECUTOR_PARSE_THRESHOLD = 32_000
+
+# Responses that mean the controller does not accept multi-shade setstate
+BULK_UNSUPPORTED_STATUSES = frozenset({400, 404, 405, 422})
+
 # Constants for retry logic
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
@@ -35,8 +47,8 @@ def convert_position_to_ha(crestron_position: int) -> int:
     if crestron_position >= OPEN_VALUE:
         return HA_OPEN_VALUE
 
-    # Convert from Crestron scale to HA scale
-    return round((crestron_position / OPEN_VALUE) * HA_OPEN_VALUE)
+    # Convert from Crestron scale to HA scale, rounding half up in integers
+    return (crestron_position * HA_OPEN_VALUE + OPEN_VALUE // 2) // OPEN_VALUE
 
 
 def convert_position_from_ha(ha_position: int) -> int:
@@ -46,13 +58,26 @@ def convert_position_from_ha(ha_position: int) -> int:
     if ha_position >= HA_OPEN_VALUE:
         return OPEN_VALUE
 
-    # Convert from HA scale to Crestron scale
-    return round((ha_position / HA_OPEN_VALUE) * OPEN_VALUE)
+    # Convert from HA scale to Crestron scale, rounding half up in integers
+    return (ha_position * OPEN_VALUE + HA_OPEN_VALUE // 2) // HA_OPEN_VALUE
+
+
+# Lookup tables for the conversions above, indexed by position. Both inputs
+# are small bounded integer ranges, so precomputing them is cheap.
+POS_TO_HA: tuple[int, ...] = tuple(
+    convert_position_to_ha(position) for position in range(OPEN_VALUE + 1)
+)
+POS_FROM_HA: tuple[int, ...] = tuple(
+    convert_position_from_ha(position) for position in range(HA_OPEN_VALUE + 1)
+)
 
 
 class ShadeState:
     """Shade state class."""
 
+    # One instance is created per shade on every poll
+    __slots__ = ("position", "id", "name", "subType", "connectionStatus", "roomId")
+
     def __init__(
         self,
         position: int,
@@ -94,6 +119,30 @@ class ShadeState:
         }
 
 
+def parse_shades(raw: bytes) -> List[ShadeState]:
+    """Parse a raw shades response body into shade states."""
+    response_json = json.loads(raw)
+
+    # Process the dictionary response containing 'shades' key
+    if not isinstance(response_json, dict) or "shades" not in response_json:
+        _LOGGER.error("Unexpected response format: %s", response_json)
+        return []
+
+    # Checked once so large responses don't pay a logger call per shade
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    shades = []
+    for shade_data in response_json["shades"]:
+        try:
+            shade = ShadeState.from_dict(shade_data)
+            shades.append(shade)
+            if debug:
+                _LOGGER.debug("Added shade: %s", shade.name)
+        except (KeyError, ValueError) as err:
+            _LOGGER.warning("Error parsing shade data: %s", err)
+
+    return shades
+
+
 class CrestronAPI:
     """Crestron API client."""
 
@@ -109,10 +158,11 @@ class CrestronAPI:
         self._host = host
         self._auth_token = auth_token
         self._auth_key = None
+        # Shared request headers; the auth key entry is refreshed on login so
+        # retried requests pick up a new key without rebuilding the dict.
+        self._auth_headers: Dict[str, str] = {}
         self._base_url = f"http://{host}/cws/api"
-        self.shades: Dict[int, Dict[str, Any]] = {}
         self._is_connected = False
-        self._connection_lock = asyncio.Lock()
         self._login_lock = asyncio.Lock()
 
     @property
@@ -148,9 +198,11 @@ class CrestronAPI:
                         self._auth_key = response_json.get("authkey")
 
                         if not self._auth_key:
+                            self._auth_headers.pop(API_AUTH_KEY_HEADER, None)
                             _LOGGER.error("Login succeeded but no auth key was returned. Response: %s", response_json)
                             raise ApiAuthError("Login succeeded but no auth key was returned")
 
+                        self._auth_headers[API_AUTH_KEY_HEADER] = self._auth_key
                         _LOGGER.info("Successfully logged in to Crestron API")
                         return self._auth_key
                     else:
@@ -256,14 +308,14 @@ class CrestronAPI:
 
     async def get_devices(self) -> List[Dict[str, Any]]:
         """Get all devices."""
-        auth_key = await self._ensure_logged_in()  # Get valid auth key
+        await self._ensure_logged_in()  # Get valid auth key
 
         # Keep the existing retry logic with 401 handling
         async def _get_devices():
             try:
                 response = await self._session.get(
                     f"{self._base_url}/devices",
-                    headers={API_AUTH_KEY_HEADER: auth_key},
+                    headers=self._auth_headers,
                     raise_for_status=True,
                     timeout=30,
                 )
@@ -292,7 +344,7 @@ class CrestronAPI:
             try:
                 response = await self._session.get(
                     f"{self._base_url}/devices/{device_id}",
-                    headers={API_AUTH_KEY_HEADER: self._auth_key},
+                    headers=self._auth_headers,
                     raise_for_status=True,
                     timeout=30,
                 )
@@ -326,31 +378,23 @@ class CrestronAPI:
                 _LOGGER.debug("Making request to %s/shades", self._base_url)
                 async with self._session.get(
                     f"{self._base_url}/shades",
-                    headers={API_AUTH_KEY_HEADER: auth_key},
+                    headers=self._auth_headers,
                     timeout=timeout,
                 ) as response:
                     if response.status == 200:
                         _LOGGER.debug("Got 200 response, parsing JSON")
-                        response_json = await response.json()
+                        raw = await response.read()
 
-                        # Process the dictionary response containing 'shades' key
-                        if isinstance(response_json, dict) and "shades" in response_json:
-                            shade_list = response_json["shades"]
-
-                            shades = []
-                            for shade_data in shade_list:
-                                try:
-                                    shade = ShadeState.from_dict(shade_data)
-                                    shades.append(shade)
-                                    _LOGGER.debug("Added shade: %s", shade.name)
-                                except (KeyError, ValueError) as err:
-                                    _LOGGER.warning("Error parsing shade data: %s", err)
-
-                            _LOGGER.info("Successfully retrieved %s shades", len(shades))
-                            return shades
+                        # Decode large payloads off the event loop
+                        if len(raw) > EXECUTOR_PARSE_THRESHOLD:
+                            shades = await self._hass.async_add_executor_job(
+                                parse_shades, raw
+                            )
                         else:
-                            _LOGGER.error("Unexpected response format: %s", response_json)
-                            return []
+                            shades = parse_shades(raw)
+
+                        _LOGGER.debug("Successfully retrieved %s shades", len(shades))
+                        return shades
                     elif response.status == 401:
                         _LOGGER.warning("Authentication error getting shades")
                         raise ApiAuthError("Invalid auth key")
@@ -378,11 +422,12 @@ class CrestronAPI:
 
     async def get_shade(self, shade_id: int) -> Optional[ShadeState]:
         """Get a shade by ID."""
+        await self._ensure_logged_in()  # Ensure logged in before getting a shade
         async def _get_shade():
             try:
                 response = await self._session.get(
                     f"{self._base_url}/shades/{shade_id}",
-                    headers={API_AUTH_KEY_HEADER: self._auth_key},
+                    headers=self._auth_headers,
                     raise_for_status=True,
                     timeout=30,  # Add explicit timeout
                 )
@@ -407,60 +452,68 @@ class CrestronAPI:
 
         return await self._execute_with_retry(_get_shade)
 
-    async def set_shades_state(self, shades: List[ShadeState]) -> bool:
-        """Set shades state."""
-        auth_key = await self._ensure_logged_in()  # Get valid auth key
+    async def _post_setstate(
+        self, shades: List[Dict[str, Any]], *, bulk: bool = False
+    ) -> bool:
+        """POST shade states to the setstate endpoint.
 
-        async def _set_shades_state():
+        With bulk set, a response meaning the controller does not accept
+        several shades in one request raises UnsupportedFeatureError.
+        """
+        await self._ensure_logged_in()  # Get valid auth key
+
+        async def _set_state():
             try:
                 response = await self._session.post(
                     f"{self._base_url}/shades/setstate",
-                    headers={
-                        API_AUTH_KEY_HEADER: auth_key,
-                        "Content-Type": "application/json",
-                    },
-                    json={"shades": [shade.to_dict() for shade in shades]},
+                    headers=self._auth_headers,
+                    json={"shades": shades},
                     raise_for_status=True,
                     timeout=30,
                 )
                 data = await response.json()
+                if not isinstance(data, dict):
+                    raise ApiError(f"Unexpected setstate response: {data!r}")
                 return data.get("status") == "success"
             except aiohttp.ClientResponseError as err:
                 if err.status == 401:
                     self._auth_key = None
                     self._is_connected = False
                     raise ApiAuthError("Invalid auth key") from err
+                if bulk and err.status in BULK_UNSUPPORTED_STATUSES:
+                    raise UnsupportedFeatureError(
+                        f"Bulk setstate not supported: {err}"
+                    ) from err
                 raise ApiError(f"Error setting shades state: {err}") from err
+            except aiohttp.ClientConnectionError:
+                # Retried by _execute_with_retry
+                raise
+            except aiohttp.ClientError as err:
+                raise ApiConnectionError(f"Error reading setstate response: {err}") from err
+            except ValueError as err:
+                raise ApiError(f"Invalid setstate response: {err}") from err
 
-        return await self._execute_with_retry(_set_shades_state)
+        return await self._execute_with_retry(_set_state)
+
+    async def set_shades_state(self, shades: List[ShadeState]) -> bool:
+        """Set shades state."""
+        return await self._post_setstate([shade.to_dict() for shade in shades])
 
     async def set_position(self, shade_id: int, position: int) -> bool:
         """Set shade position."""
-        auth_key = await self._ensure_logged_in()  # Get valid auth key
         _LOGGER.debug("Setting shade %s position to %s", shade_id, position)
-
-        async def _set_shades_position():
-            try:
-                response = await self._session.post(
-                    f"{self._base_url}/shades/setstate",
-                    headers={
-                        API_AUTH_KEY_HEADER: auth_key,
-                        "Content-Type": "application/json",
-                    },
-                    json={"shades": [{"id": shade_id, "position": position}]},
-                    raise_for_status=True,
-                    timeout=30,
-                )
-                data = await response.json()
-                return data.get("status") == "success"
-            except aiohttp.ClientResponseError as err:
-                if err.status == 401:
-                    self._auth_key = None
-                    self._is_connected = False
-                    raise ApiAuthError("Invalid auth key") from err
-                raise ApiError(f"Error setting shade position: {err}") from err
-
-        return await self._execute_with_retry(_set_shades_position)
+        return await self._post_setstate([{"id": shade_id, "position": position}])
+
+    async def set_positions_bulk(self, updates: Dict[int, int]) -> bool:
+        """Set several shade positions (0-65535) in a single request."""
+        _LOGGER.debug("Setting positions for %s shades", len(updates))
+        return await self._post_setstate(
+            [
+                {"id": shade_id, "position": position}
+                for shade_id, position in updates.items()
+            ],
+            bulk=True,
+        )
 
     async def open_shade(self, shade_id: int) -> bool:
         """Open a shade."""
@@ -480,25 +533,21 @@ class CrestronAPI:
 
     async def stop_shade(self, shade_id: int) -> bool:
         """Stop a shade by setting it to its current position."""
+        return await self.stop_shade_at(shade_id) is not None
+
+    async def stop_shade_at(self, shade_id: int) -> Optional[int]:
+        """Stop a shade and return the position (0-65535) it stopped at.
+
+        Returns None if the shade was not found or the stop failed.
+        """
         _LOGGER.debug("Stopping shade %s by setting to current position", shade_id)
 
         try:
-            # Step 1: Fetch all shades to get the current position
-            all_shades = await self.get_shades()
-            if not all_shades:
-                _LOGGER.error("Failed to get shades for stopping shade %s", shade_id)
-                return False
-
-            # Find the specific shade we want to stop
-            target_shade = None
-            for shade in all_shades:
-                if shade.id == shade_id:
-                    target_shade = shade
-                    break
-
+            # Step 1: Fetch just this shade to get the current position
+            target_shade = await self.get_shade(shade_id)
             if not target_shade:
-                _LOGGER.error("Shade %s not found in the list of shades", shade_id)
-                return False
+                _LOGGER.error("Shade %s not found", shade_id)
+                return None
 
             # Get the current position
             current_position = target_shade.position
@@ -508,17 +557,13 @@ class CrestronAPI:
             result = await self.set_position(shade_id, current_position)
 
             if result:
-                _LOGGER.info("Successfully stopped shade %s at position %s",
+                _LOGGER.debug("Successfully stopped shade %s at position %s",
                             shade_id, current_position)
-            else:
-                _LOGGER.error("Failed to stop shade %s", shade_id)
+                return current_position
 
-            return result
+            _LOGGER.error("Failed to stop shade %s", shade_id)
+            return None
 
         except Exception as err:
             _LOGGER.error("Error stopping shade %s: %s", shade_id, err)
-            return False
-
-    def has_shade(self, shade_id: int) -> bool:
-        """Check if a shade exists."""
-        return shade_id in self.shades
\ No newline at end of file
+            return None
\ No newline at end of file
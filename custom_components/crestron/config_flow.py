@@ -2,22 +2,42 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable
+import functools
 import logging
-from typing import Any, cast
+from time import monotonic
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 
-from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, OptionsFlow
 from homeassistant.const import CONF_HOST
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
-import homeassistant.helpers.config_validation as cv
 
-from .const import CONF_AUTH_TOKEN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_AUTH_TOKEN,
+    CONF_REFRESH_AFTER_COMMAND,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_REFRESH_AFTER_COMMAND,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    host_unique_id,
+)
+
+if TYPE_CHECKING:
+    from .api import CrestronAPI
 
 _LOGGER = logging.getLogger(__name__)
 
+# Upper bound on concurrent controller probes in parallel_validate
+PARALLEL_VALIDATE_LIMIT = 8
+
+# Hosts whose ping failed recently, mapped to the monotonic failure time
+_PING_FAIL_CACHE: dict[str, float] = {}
+_PING_FAIL_TTL = 30  # seconds
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -26,22 +46,92 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
     }
 )
 
+STEP_ZEROCONF_CONFIRM_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_AUTH_TOKEN): str,
+        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
+    }
+)
 
-async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
+STEP_REAUTH_DATA_SCHEMA = vol.Schema({vol.Required(CONF_AUTH_TOKEN): str})
+
+
+@functools.lru_cache(maxsize=8)
+def _options_schema(default_interval: int, default_refresh: bool) -> vol.Schema:
+    """Return the options schema for the given defaults."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_SCAN_INTERVAL, default=default_interval): int,
+            vol.Optional(CONF_REFRESH_AFTER_COMMAND, default=default_refresh): bool,
+        }
+    )
+
+
+def _title(host: str) -> str:
+    """Return the config entry title for a host."""
+    return f"Crestron ({host})"
+
+
+async def validate_input(
+    hass: HomeAssistant,
+    data: dict[str, Any],
+    api: CrestronAPI | None = None,
+) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     # Import here to avoid blocking at module load time
-    from .api import CrestronAPI, ApiAuthError, ApiError
+    from .api import ApiConnectionError
 
-    api = CrestronAPI(
-        hass=hass,
-        host=data[CONF_HOST],
-        auth_token=data[CONF_AUTH_TOKEN],
-    )
+    host = data[CONF_HOST]
 
-    await api.ping()
+    # Answer repeated probes of a host that just failed without hitting the network
+    failed_at = _PING_FAIL_CACHE.get(host)
+    if failed_at is not None and monotonic() - failed_at < _PING_FAIL_TTL:
+        raise ApiConnectionError(f"Recent connection failure for {host}")
+
+    if api is None:
+        from .api import CrestronAPI
+
+        api = CrestronAPI(
+            hass=hass,
+            host=host,
+            auth_token=data[CONF_AUTH_TOKEN],
+        )
+
+    try:
+        reachable = await api.ping()
+    except Exception:
+        _PING_FAIL_CACHE[host] = monotonic()
+        raise
+
+    if not reachable:
+        _PING_FAIL_CACHE[host] = monotonic()
+        raise ApiConnectionError(f"Failed to ping {host}")
+
+    _PING_FAIL_CACHE.pop(host, None)
 
     # Return validated data
-    return {"title": f"Crestron ({data[CONF_HOST]})"}
+    return {"title": _title(data[CONF_HOST])}
+
+
+async def _guarded(sem: asyncio.Semaphore, coro: Awaitable[Any]) -> Any:
+    """Await a coroutine while holding the semaphore."""
+    async with sem:
+        return await coro
+
+
+async def parallel_validate(
+    hass: HomeAssistant, items: list[dict[str, Any]]
+) -> list[dict[str, Any] | BaseException]:
+    """Validate several host/token pairs concurrently.
+
+    Results are returned in input order; failures are returned as the raised
+    exception instead of aborting the whole batch.
+    """
+    sem = asyncio.Semaphore(PARALLEL_VALIDATE_LIMIT)
+    return await asyncio.gather(
+        *(_guarded(sem, validate_input(hass, data)) for data in items),
+        return_exceptions=True,
+    )
 
 
 class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -53,6 +143,32 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
         """Initialize the config flow."""
         self.discovery_info = None
         self.entry: ConfigEntry | None = None
+        self._api_cache: dict[tuple[str, str], CrestronAPI] = {}
+
+    def _get_api(self, host: str, auth_token: str) -> CrestronAPI:
+        """Return the API client for a host/token pair, reusing it across steps."""
+        key = (host, auth_token)
+        api = self._api_cache.get(key)
+        if api is None:
+            # Import here to avoid blocking at module load time
+            from .api import CrestronAPI
+
+            api = CrestronAPI(hass=self.hass, host=host, auth_token=auth_token)
+            self._api_cache[key] = api
+        return api
+
+    async def _async_validate(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Validate input using the cached API client for this flow."""
+        return await validate_input(
+            self.hass, data, self._get_api(data[CONF_HOST], data[CONF_AUTH_TOKEN])
+        )
+
+    @callback
+    def async_remove(self) -> None:
+        """Drop cached API clients when the flow goes away."""
+        # Clients share Home Assistant's aiohttp session, so releasing the
+        # references is enough; the session itself must not be closed here.
+        self._api_cache.clear()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -65,8 +181,8 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             try:
-                info = await validate_input(self.hass, user_input)
-                await self.async_set_unique_id(f"crestron_{user_input[CONF_HOST]}")
+                info = await self._async_validate(user_input)
+                await self.async_set_unique_id(host_unique_id(user_input[CONF_HOST]))
                 self._abort_if_unique_id_configured()
                 return self.async_create_entry(title=info["title"], data=user_input)
             except ApiAuthError:
@@ -84,7 +200,7 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
         """Handle zeroconf discovery."""
         # Get host from discovery
         host = discovery_info.get("host", "")
-        unique_id = f"crestron_{host}"
+        unique_id = host_unique_id(host)
 
         # Set unique ID
         await self.async_set_unique_id(unique_id)
@@ -92,7 +208,7 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
 
         # Store for the next step
         self.discovery_info = discovery_info
-        self.context["title_placeholders"] = {"name": f"Crestron ({host})"}
+        self.context["title_placeholders"] = {"name": _title(host)}
 
         return await self.async_step_zeroconf_confirm()
 
@@ -111,35 +227,26 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 user_input[CONF_HOST] = host
-                info = await validate_input(self.hass, user_input)
+                info = await self._async_validate(user_input)
                 return self.async_create_entry(title=info["title"], data=user_input)
             except ApiAuthError:
                 return self.async_show_form(
                     step_id="zeroconf_confirm",
-                    data_schema=vol.Schema({
-                        vol.Required(CONF_AUTH_TOKEN): str,
-                        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
-                    }),
+                    data_schema=STEP_ZEROCONF_CONFIRM_SCHEMA,
                     errors={"base": "invalid_auth"},
                     description_placeholders={"host": host},
                 )
             except (ApiError, Exception):
                 return self.async_show_form(
                     step_id="zeroconf_confirm",
-                    data_schema=vol.Schema({
-                        vol.Required(CONF_AUTH_TOKEN): str,
-                        vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
-                    }),
+                    data_schema=STEP_ZEROCONF_CONFIRM_SCHEMA,
                     errors={"base": "cannot_connect"},
                     description_placeholders={"host": host},
                 )
 
         return self.async_show_form(
             step_id="zeroconf_confirm",
-            data_schema=vol.Schema({
-                vol.Required(CONF_AUTH_TOKEN): str,
-                vol.Optional(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): int,
-            }),
+            data_schema=STEP_ZEROCONF_CONFIRM_SCHEMA,
             description_placeholders={"host": host},
         )
 
@@ -157,20 +264,23 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
 
         errors = {}
 
-        if user_input is not None and self.entry:
-            host = self.entry.data[CONF_HOST]
-            scan_interval = self.entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        entry_data = self.entry.data if self.entry else {}
+        host = entry_data.get(CONF_HOST)
 
+        if user_input is not None and self.entry:
             try:
-                # Create new data with existing host but new auth token
+                # Keep the existing data (host, persisted hub ID) and swap
+                # in the new auth token
                 data = {
-                    CONF_HOST: host,
+                    CONF_SCAN_INTERVAL: DEFAULT_SCAN_INTERVAL,
+                    **entry_data,
                     CONF_AUTH_TOKEN: user_input[CONF_AUTH_TOKEN],
-                    CONF_SCAN_INTERVAL: scan_interval
                 }
 
-                # Validate
-                await validate_input(self.hass, data)
+                # Validate, logging in so the token itself is checked; the
+                # stored token may still be valid if reauth followed an outage
+                await self._async_validate(data)
+                await self._get_api(host, data[CONF_AUTH_TOKEN]).login()
 
                 # Update the config entry
                 self.hass.config_entries.async_update_entry(
@@ -188,9 +298,9 @@ class CrestronConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=vol.Schema({vol.Required(CONF_AUTH_TOKEN): str}),
+            data_schema=STEP_REAUTH_DATA_SCHEMA,
             errors=errors,
-            description_placeholders={"host": self.entry.data.get(CONF_HOST) if self.entry else "unknown"},
+            description_placeholders={"host": host if self.entry else "unknown"},
         )
 
     @staticmethod
@@ -206,8 +316,9 @@ class CrestronOptionsFlow(OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         """Initialize options flow."""
         self.entry_id = config_entry.entry_id
-        self.entry_data = dict(config_entry.data)
-        self.entry_options = dict(config_entry.options)
+        # Entry data and options are read-only mappings; keep references
+        self.entry_data = config_entry.data
+        self.entry_options = config_entry.options
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -218,13 +329,11 @@ class CrestronOptionsFlow(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
-        options_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_SCAN_INTERVAL,
-                    default=self.entry_options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
-                ): int,
-            }
+        options_schema = _options_schema(
+            self.entry_options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            self.entry_options.get(
+                CONF_REFRESH_AFTER_COMMAND, DEFAULT_REFRESH_AFTER_COMMAND
+            ),
         )
 
         return self.async_show_form(
@@ -13,9 +13,12 @@ CONF_HOST: Final = "host"
 CONF_PORT: Final = "port"
 CONF_AUTH_TOKEN: Final = "auth_token"
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_REFRESH_AFTER_COMMAND: Final = "refresh_after_command"
+CONF_HUB_ID: Final = "hub_id"
 
 # Default values
 DEFAULT_SCAN_INTERVAL: Final = 30
+DEFAULT_REFRESH_AFTER_COMMAND: Final = False
 DEFAULT_NAME: Final = "Crestron"
 
 # Update interval
@@ -43,6 +46,12 @@ DEV_CRESTRON_HUB: Final = "Crestron Hub"
 EVENT_SHADE_UPDATED: Final = f"{DOMAIN}_shade_updated"
 EVENT_CONNECTION_STATUS_CHANGED: Final = f"{DOMAIN}_connection_status_changed"
 
+
+def host_unique_id(host: str) -> str:
+    """Return the unique ID shared by a controller's config entry and hub."""
+    return f"{DOMAIN}_{host}"
+
+
 # Logger
 _LOGGER = logging.getLogger(__package__)
 LOGGER = logging.getLogger(__name__)
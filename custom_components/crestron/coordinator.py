@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, fields
 from datetime import timedelta
 import logging
-from typing import Any, Dict
+from operator import attrgetter
+import time
+from typing import Any, Dict, TypeVar
 
-import async_timeout
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 
@@ -19,15 +22,98 @@ from .api import (
     ApiConnectionError,
     ApiTimeoutError,
     CrestronAPI,
+    CLOSED_VALUE,
     HA_OPEN_VALUE,
     HA_CLOSED_VALUE,
+    OPEN_VALUE,
+    POS_FROM_HA,
+    POS_TO_HA,
+    UnsupportedFeatureError,
     convert_position_to_ha,
     convert_position_from_ha
 )
-from .const import DOMAIN, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    CONF_REFRESH_AFTER_COMMAND,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_REFRESH_AFTER_COMMAND,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    host_unique_id,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Window in which refresh requests from shade commands are coalesced
+COMMAND_REFRESH_COOLDOWN = 0.15
+
+# Window in which position commands are collected into one request
+COMMAND_BATCH_WINDOW = 0.025
+
+# Maximum shade commands sent to the controller at once
+MAX_CONCURRENT_COMMANDS = 4
+
+# Adaptive polling: back off exponentially while the controller is failing,
+# and slow down gradually while no shade changes between polls
+MAX_BACKOFF_EXPONENT = 6
+MAX_BACKOFF_SECONDS = 600
+IDLE_POLLS_BEFORE_SLOWDOWN = 5
+IDLE_SLOWDOWN_FACTOR = 1.5
+MAX_IDLE_MULTIPLIER = 4
+
+# A command refresh is skipped when the scheduled poll is this close (seconds)
+REFRESH_SKIP_WINDOW = 2
+
+# At most this many shade command errors are logged per window (seconds)
+COMMAND_ERROR_LOG_LIMIT = 5
+COMMAND_ERROR_LOG_WINDOW = 60
+
+
+@dataclass(slots=True)
+class ShadeData:
+    """Cached state of a single shade."""
+
+    id: int
+    name: str
+    position: int
+    connection_status: str
+    room_id: int
+    type: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the shade as a plain dictionary."""
+        return dict(zip(_SHADE_FIELD_NAMES, _SHADE_VALUES(self)))
+
+
+_SHADE_FIELD_NAMES = tuple(field.name for field in fields(ShadeData))
+# Reads every ShadeData field in one C-level call for serialization
+_SHADE_VALUES = attrgetter(*_SHADE_FIELD_NAMES)
+
+# Fetches every field the poll needs from an API shade in one call
+_SHADE_ATTRS = attrgetter(
+    "id", "name", "position", "connectionStatus", "roomId", "subType"
+)
+
+
+def _to_crestron_position(position: int) -> int:
+    """Convert a Home Assistant position using the lookup table when in range."""
+    if HA_CLOSED_VALUE <= position <= HA_OPEN_VALUE:
+        return POS_FROM_HA[position]
+    return convert_position_from_ha(position)
+
+
+def _to_ha_position(raw_position: int) -> int:
+    """Convert a Crestron position using the lookup table when in range."""
+    if CLOSED_VALUE <= raw_position <= OPEN_VALUE:
+        return POS_TO_HA[raw_position]
+    return convert_position_to_ha(raw_position)
+
+
+def _error_kind(err: ApiError) -> str:
+    """Return the log prefix for a connection or timeout error."""
+    return "Timeout" if isinstance(err, ApiTimeoutError) else "Connection error"
+
 
 class CrestronCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
     """Crestron coordinator."""
@@ -36,8 +122,23 @@ class CrestronCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
         """Initialize coordinator."""
         self.api = api
         self.options = options
+        # The host never changes for the lifetime of the coordinator
+        self._unique_id = host_unique_id(api.host)
         self.platforms = []
-        self._shades = {}
+        self._shades: Dict[int, ShadeData] = {}
+        # Data object handed to listeners. It is replaced only when a poll
+        # changes something, so the base class can skip no-op updates
+        self._revision = 0
+        self._data: Dict[str, Any] = {
+            "shades": self._shades,
+            "connected": False,
+            "revision": self._revision,
+        }
+        # Per-field indexes for hot single-field reads (availability, positions)
+        self._positions: Dict[int, int] = {}
+        self._conn_status: Dict[int, str] = {}
+        # Shades whose cached record changed since the last poll started
+        self._changed_ids: set[int] = set()
         scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
         super().__init__(
@@ -45,79 +146,252 @@ class CrestronCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            always_update=False,
         )
         self._is_connected = False
         self._connection_errors = 0
         self._max_connection_errors = 3
 
+        # Configured interval that adaptive polling returns to
+        self._base_interval = timedelta(seconds=scan_interval)
+
+        # Cleared if the controller rejects multi-shade setstate requests
+        self._bulk_supported = True
+
+        # Position commands waiting for the batch window to close
+        self._pending_sets: Dict[int, int] = {}
+        self._pending_waiters: Dict[int, list[asyncio.Future[bool]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+        # Rate limiting state for shade command error logs
+        self._error_window_start = 0.0
+        self._errors_in_window = 0
+        self._suppressed_errors = 0
+
+        # Event loop time the next poll is scheduled from (the last poll's end
+        # or the last reschedule), used to spot imminent polls; the base
+        # coordinator schedules polls on the same loop clock
+        self._last_poll_time: float | None = None
+        # Event loop times of the last successful poll and last shade command
+        self._last_success_time: float | None = None
+        self._last_command_time: float | None = None
+
+        # Fetch in progress, shared by overlapping refreshes
+        self._update_future: asyncio.Future[Dict[str, Any]] | None = None
+        self._idle_polls = 0
+
+        # The API client uses Home Assistant's shared aiohttp session, so
+        # connections are pooled already; this bounds concurrent commands
+        self._api_sem = asyncio.Semaphore(MAX_CONCURRENT_COMMANDS)
+
+        # Optimistic state is pushed after commands; a follow-up poll is opt-in
+        self._refresh_after_command = options.get(
+            CONF_REFRESH_AFTER_COMMAND, DEFAULT_REFRESH_AFTER_COMMAND
+        )
+
+        # Coalesces refreshes requested by bursts of shade commands into one poll
+        self._pending_refresh = False
+        self._refresh_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=COMMAND_REFRESH_COOLDOWN,
+            immediate=False,
+            function=self._async_debounced_refresh,
+        )
+
     @property
-    def shades(self) -> Dict[int, Dict[str, Any]]:
+    def shades(self) -> Dict[int, ShadeData]:
         """Return cached shades."""
         return self._shades
 
     @property
     def unique_id(self) -> str:
         """Return a unique ID."""
-        return f"crestron_{self.api.host}"
+        return self._unique_id
+
+    def get_position(self, shade_id: int) -> int | None:
+        """Return the cached position (0-100) of a shade."""
+        return self._positions.get(shade_id)
+
+    def get_connection_status(self, shade_id: int) -> str | None:
+        """Return the cached connection status of a shade."""
+        return self._conn_status.get(shade_id)
+
+    def is_confirmed_at(self, shade_id: int, position: int) -> bool:
+        """Return True if a fresh poll reported the shade at the position.
+
+        The poll must have succeeded after the last shade command and within
+        the configured interval, so optimistic or stale positions don't count.
+        """
+        if self._last_success_time is None or not self.last_update_success:
+            return False
+        if (
+            self._last_command_time is not None
+            and self._last_command_time >= self._last_success_time
+        ):
+            return False
+        age = self.hass.loop.time() - self._last_success_time
+        if age > self._base_interval.total_seconds():
+            return False
+        return self._positions.get(shade_id) == position
+
+    @property
+    def changed_ids(self) -> set[int]:
+        """Return IDs of shades changed by the latest poll or commands since."""
+        return self._changed_ids
 
     @property
     def is_connected(self) -> bool:
         """Return if api is connected."""
         return self._is_connected
 
+    async def _async_debounced_refresh(self) -> None:
+        """Refresh once for a burst of shade commands."""
+        if self._pending_refresh:
+            # A refresh is already running; it will pick up the new state
+            return
+        self._pending_refresh = True
+        try:
+            await self.async_refresh()
+        finally:
+            self._pending_refresh = False
+
+    @callback
+    def async_request_refresh_debounced(self) -> None:
+        """Schedule one refresh for a burst of requests, without waiting."""
+        self._refresh_debouncer.async_schedule_call()
+
+    async def async_shutdown(self) -> None:
+        """Cancel pending command refreshes and shut down the coordinator."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_pending()
+        self._refresh_debouncer.async_shutdown()
+        await super().async_shutdown()
+
     async def _async_update_data(self) -> Dict[str, Any]:
+        """Fetch data from API endpoint, sharing any fetch already in flight."""
+        if self._update_future is not None and not self._update_future.done():
+            return await asyncio.shield(self._update_future)
+
+        future: asyncio.Future[Dict[str, Any]] = self.hass.loop.create_future()
+        self._update_future = future
+        try:
+            data = await self._async_fetch_data()
+        except asyncio.CancelledError:
+            # Joined callers were not cancelled themselves; fail them instead
+            future.set_exception(UpdateFailed("Shared update was cancelled"))
+            future.exception()
+            raise
+        except Exception as err:
+            self._mark_disconnected()
+            future.set_exception(err)
+            # Mark retrieved so an unawaited future does not log a warning
+            future.exception()
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            self._update_future = None
+            self._last_poll_time = self.hass.loop.time()
+
+    def _mark_disconnected(self) -> None:
+        """Record a failed poll so the next successful one publishes new data."""
+        if self._data["connected"]:
+            self._revision += 1
+            self._data = {
+                "shades": self._shades,
+                "connected": False,
+                "revision": self._revision,
+            }
+
+    async def _async_fetch_data(self) -> Dict[str, Any]:
         """Fetch data from API endpoint."""
+        # Entities subscribe with their shade ID as context; with every shade
+        # entity disabled or removed there is nobody to refresh for
+        if self._shades and not any(True for _ in self.async_contexts()):
+            return self._data
+
         try:
-            async with async_timeout.timeout(30):
-                # First try to ping to check connectivity
-                try:
-                    if not await self.api.ping():
-                        self._connection_errors += 1
-                        if self._connection_errors >= self._max_connection_errors:
-                            self._is_connected = False
-                            _LOGGER.warning(
-                                "Failed to ping Crestron API after %s attempts",
-                                self._connection_errors
-                            )
-                        raise ApiConnectionError("Failed to ping API")
-                    else:
-                        # Reset error counter on successful ping
-                        self._connection_errors = 0
-                        self._is_connected = True
-                except (ApiConnectionError, ApiTimeoutError) as err:
-                    self._connection_errors += 1
-                    if self._connection_errors >= self._max_connection_errors:
-                        self._is_connected = False
-                    _LOGGER.debug("Ping failed: %s", err)
-                    raise
-
-                # Fetch shades
+            # One deadline covers the probe, login and fetch together
+            async with asyncio.timeout(30):
+                # While the controller is known to be down, probe it with the
+                # cheap unauthenticated ping before attempting a full fetch
+                if (
+                    not self._is_connected
+                    and self._connection_errors >= self._max_connection_errors
+                    and not await self.api.ping()
+                ):
+                    raise ApiConnectionError("Failed to ping API")
+
+                # Fetch shades; a successful fetch doubles as the liveness check
                 shade_states = await self.api.get_shades()
 
-                # Convert to dictionary keyed by ID for easier lookups
-                self._shades = {
-                    shade.id: {
-                        "id": shade.id,
-                        "name": shade.name,
-                        "position": convert_position_to_ha(shade.position),
-                        "connection_status": shade.connectionStatus,
-                        "room_id": shade.roomId,
-                        "type": shade.subType,
-                    }
-                    for shade in shade_states
-                }
+                # Update the cache keyed by ID in place so references held by
+                # entities stay valid; only new shades allocate a record
+                seen = set()
+                changed_ids = self._changed_ids
+                changed_ids.clear()
+                for shade in shade_states:
+                    shade_id, name, raw_position, status, room_id, sub_type = (
+                        _SHADE_ATTRS(shade)
+                    )
+                    seen.add(shade_id)
+                    self._conn_status[shade_id] = status
+                    position = _to_ha_position(raw_position)
+                    self._positions[shade_id] = position
+                    entry = self._shades.get(shade_id)
+                    if entry is None:
+                        self._shades[shade_id] = ShadeData(
+                            id=shade_id,
+                            name=name,
+                            position=position,
+                            connection_status=status,
+                            room_id=room_id,
+                            type=sub_type,
+                        )
+                        changed_ids.add(shade_id)
+                        continue
+                    if (
+                        entry.position == position
+                        and entry.connection_status == status
+                        and entry.name == name
+                        and entry.room_id == room_id
+                        and entry.type == sub_type
+                    ):
+                        continue
+                    entry.position = position
+                    entry.connection_status = status
+                    entry.name = name
+                    entry.room_id = room_id
+                    entry.type = sub_type
+                    changed_ids.add(shade_id)
+
+                # Drop shades the controller no longer reports
+                for gone in self._shades.keys() - seen:
+                    del self._shades[gone]
+                    del self._positions[gone]
+                    del self._conn_status[gone]
+                    changed_ids.add(gone)
 
                 # If we got here, update was successful
                 if not self._is_connected:
                     _LOGGER.info("Connection to Crestron API restored")
                 self._is_connected = True
                 self._connection_errors = 0
-
-                # Return data
-                return {
-                    "shades": self._shades,
-                    "connected": self._is_connected,
-                }
+                self._last_success_time = self.hass.loop.time()
+                self._adapt_idle_interval()
+
+                # Return data; an unchanged poll returns the previous object
+                if changed_ids or not self._data["connected"]:
+                    self._revision += 1
+                    self._data = {
+                        "shades": self._shades,
+                        "connected": True,
+                        "revision": self._revision,
+                    }
+                return self._data
         except ApiAuthError as err:
             self._is_connected = False
             # Raising ConfigEntryAuthFailed will cancel future updates
@@ -131,12 +405,14 @@ class CrestronCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
                     "Connection lost to Crestron API after %s consecutive errors",
                     self._connection_errors
                 )
+            self._apply_backoff()
             _LOGGER.error("Connection error during update: %s", err)
             raise UpdateFailed(f"Error connecting to API: {err}") from err
         except ApiTimeoutError as err:
             self._connection_errors += 1
             if self._connection_errors >= self._max_connection_errors:
                 self._is_connected = False
+            self._apply_backoff()
             _LOGGER.error("Timeout during update: %s", err)
             raise UpdateFailed(f"Timeout connecting to API: {err}") from err
         except ApiError as err:
@@ -146,149 +422,332 @@ class CrestronCoordinator(DataUpdateCoordinator[Dict[str, Any]]):
             self._connection_errors += 1
             if self._connection_errors >= self._max_connection_errors:
                 self._is_connected = False
+            self._apply_backoff()
             _LOGGER.error("Async timeout during update: %s", err)
             raise UpdateFailed(f"Timeout during update: {err}") from err
         except Exception as err:
             _LOGGER.exception("Unexpected error during update: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    def _apply_backoff(self) -> None:
+        """Lengthen the poll interval exponentially with consecutive errors."""
+        base = self._base_interval.total_seconds()
+        exponent = min(self._connection_errors, MAX_BACKOFF_EXPONENT)
+        self.update_interval = timedelta(
+            seconds=min(base * 2**exponent, max(base, MAX_BACKOFF_SECONDS))
+        )
+        self._idle_polls = 0
+
+    def _adapt_idle_interval(self) -> None:
+        """Slow polling while no shade changes between polls, else reset it."""
+        if self._changed_ids:
+            self._idle_polls = 0
+            self.update_interval = self._base_interval
+            return
+
+        self._idle_polls += 1
+        if self._idle_polls < IDLE_POLLS_BEFORE_SLOWDOWN:
+            self.update_interval = self._base_interval
+            return
+
+        self.update_interval = min(
+            self.update_interval * IDLE_SLOWDOWN_FACTOR,
+            self._base_interval * MAX_IDLE_MULTIPLIER,
+        )
+
+    def _reset_interval(self) -> None:
+        """Return to the configured poll interval after user activity."""
+        self._idle_polls = 0
+        if self.update_interval == self._base_interval:
+            return
+        slowed_interval = self.update_interval
+        self.update_interval = self._base_interval
+        # Changing the interval does not move a poll that is already
+        # scheduled, so pull the next poll in if it is further than one
+        # configured interval away
+        if (
+            self._last_poll_time is not None
+            and slowed_interval is not None
+            and self._last_poll_time + slowed_interval.total_seconds()
+            > self.hass.loop.time() + self._base_interval.total_seconds()
+        ):
+            self._schedule_refresh()
+            self._last_poll_time = self.hass.loop.time()
+
     def has_shade(self, shade_id: int) -> bool:
         """Check if shade exists."""
         return shade_id in self._shades
 
-    async def open_shade(self, shade_id: int) -> bool:
-        """Open a shade."""
-        if not self.has_shade(shade_id):
-            _LOGGER.error("Shade %s not found", shade_id)
-            return False
+    async def _async_limited(self, coro: Awaitable[_T]) -> _T:
+        """Await an API command while holding the command semaphore."""
+        async with self._api_sem:
+            return await coro
+
+    async def _async_gather_positions(
+        self, targets: Dict[int, int]
+    ) -> list[bool | BaseException]:
+        """Send one set_position request per shade concurrently."""
+        return await asyncio.gather(
+            *(
+                self._async_limited(self.api.set_position(shade_id, position))
+                for shade_id, position in targets.items()
+            ),
+            return_exceptions=True,
+        )
 
-        try:
-            result = await self.api.open_shade(shade_id)
+    async def async_set_positions(
+        self, updates: Dict[int, int]
+    ) -> Dict[int, bool | BaseException]:
+        """Set several shade positions (0-100) at once.
+
+        Multiple shades are sent to the controller in one bulk request; if the
+        controller rejects the bulk form, requests are sent per shade instead.
+        Returns the API result or raised exception for each shade ID. Local
+        state is updated for every successful shade and listeners are notified
+        once for the whole batch.
+        """
+        shade_ids = list(updates)
+        targets = {
+            shade_id: _to_crestron_position(position)
+            for shade_id, position in updates.items()
+        }
+
+        results: list[bool | BaseException]
+        if len(targets) > 1 and self._bulk_supported:
+            try:
+                bulk_result = await self._async_limited(
+                    self.api.set_positions_bulk(targets)
+                )
+            except (ApiAuthError, ApiConnectionError, ApiTimeoutError) as err:
+                results = [err] * len(targets)
+            except UnsupportedFeatureError as err:
+                _LOGGER.debug("Bulk position update rejected, sending per shade: %s", err)
+                self._bulk_supported = False
+                results = await self._async_gather_positions(targets)
+            except ApiError as err:
+                # Possibly transient; fall back for this batch only
+                _LOGGER.debug("Bulk position update failed, sending per shade: %s", err)
+                results = await self._async_gather_positions(targets)
+            else:
+                results = [bulk_result] * len(targets)
+        else:
+            results = await self._async_gather_positions(targets)
+
+        outcome: Dict[int, bool | BaseException] = {}
+        changed = False
+        for shade_id, result in zip(shade_ids, results):
+            outcome[shade_id] = result
+            shade = self._shades.get(shade_id)
+            # Skip the push when the cached position already matches
+            if result is True and shade is not None:
+                if shade.position != updates[shade_id]:
+                    shade.position = updates[shade_id]
+                    self._positions[shade_id] = updates[shade_id]
+                    self._changed_ids.add(shade_id)
+                    changed = True
+
+        # The data object is mutated in place, so just notify listeners
+        if changed:
+            self.async_update_listeners()
+        return outcome
+
+    async def _async_set_single(self, shade_id: int, position: int) -> bool:
+        """Queue one shade position for the next batch, re-raising its error.
+
+        Commands arriving within COMMAND_BATCH_WINDOW of each other (e.g. a
+        scene moving many shades) are sent as one bulk request.
+        """
+        future: asyncio.Future[bool] = self.hass.loop.create_future()
+        # A later command for the same shade within the window wins
+        self._pending_sets[shade_id] = position
+        self._pending_waiters.setdefault(shade_id, []).append(future)
+        if self._flush_handle is None:
+            self._flush_handle = self.hass.loop.call_later(
+                COMMAND_BATCH_WINDOW, self._flush_pending
+            )
+        return await future
+
+    @callback
+    def _flush_pending(self) -> None:
+        """Send the queued position commands as one batch."""
+        self._flush_handle = None
+        pending, self._pending_sets = self._pending_sets, {}
+        waiters, self._pending_waiters = self._pending_waiters, {}
+        if not pending:
+            return
+        self.hass.async_create_background_task(
+            self._async_send_batch(pending, waiters),
+            name="crestron-set-positions",
+            eager_start=True,
+        )
 
-            # Update local state immediately on success
-            if result and shade_id in self._shades:
-                self._shades[shade_id]["position"] = HA_OPEN_VALUE
-                self.async_set_updated_data({"shades": self._shades})
-                _LOGGER.debug("Successfully opened shade %s", shade_id)
+    async def _async_send_batch(
+        self,
+        pending: Dict[int, int],
+        waiters: Dict[int, list[asyncio.Future[bool]]],
+    ) -> None:
+        """Send a batch of positions and resolve each waiting command."""
+        outcome: Dict[int, bool | BaseException] = {}
+        try:
+            outcome = await self.async_set_positions(pending)
+        except Exception as err:  # pylint: disable=broad-except
+            outcome = dict.fromkeys(pending, err)
+        finally:
+            # Resolve every waiter even if this task is cancelled (e.g. on
+            # unload), so no service call is left hanging
+            for shade_id, futures in waiters.items():
+                result = outcome.get(shade_id)
+                if result is None:
+                    result = ApiError("Shade command batch was cancelled")
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
 
-            # Schedule refresh to get the latest state
-            await self.async_request_refresh()
-            return result
-        except ApiConnectionError as err:
-            _LOGGER.error("Connection error opening shade %s: %s", shade_id, err)
-            return False
-        except ApiTimeoutError as err:
-            _LOGGER.error("Timeout opening shade %s: %s", shade_id, err)
-            return False
-        except ApiAuthError as err:
-            _LOGGER.error("Authentication error opening shade %s: %s", shade_id, err)
-            # Trigger a full refresh to re-authenticate
-            self.async_set_updated_data(None)
-            await self.async_request_refresh()
+    def _poll_due_soon(self) -> bool:
+        """Return True if the next scheduled poll is within the skip window."""
+        if self._last_poll_time is None or self.update_interval is None:
             return False
-        except Exception as err:
-            _LOGGER.error("Error opening shade %s: %s", shade_id, err)
+        remaining = self.update_interval.total_seconds() - (
+            self.hass.loop.time() - self._last_poll_time
+        )
+        return remaining < REFRESH_SKIP_WINDOW
+
+    def _log_command_error(self, msg: str, *args: Any) -> None:
+        """Log a command error, rate limited so outages don't flood the log."""
+        now = time.monotonic()
+        if now - self._error_window_start >= COMMAND_ERROR_LOG_WINDOW:
+            if self._suppressed_errors:
+                _LOGGER.error(
+                    "Suppressed %s further shade command errors in the last %s seconds",
+                    self._suppressed_errors,
+                    COMMAND_ERROR_LOG_WINDOW,
+                )
+            self._error_window_start = now
+            self._errors_in_window = 0
+            self._suppressed_errors = 0
+
+        if self._errors_in_window >= COMMAND_ERROR_LOG_LIMIT:
+            self._suppressed_errors += 1
+            return
+
+        self._errors_in_window += 1
+        _LOGGER.error(msg, *args)
+
+    async def _async_stop(self, shade_id: int) -> bool:
+        """Stop a shade and store the position it stopped at."""
+        # A move still waiting for the batch window would otherwise be sent
+        # after the stop and restart the shade
+        self._pending_sets.pop(shade_id, None)
+        for future in self._pending_waiters.pop(shade_id, ()):
+            if not future.done():
+                future.set_result(False)
+
+        # The API reads the current position to stop at, so no read-back is needed
+        raw_position = await self._async_limited(self.api.stop_shade_at(shade_id))
+        if raw_position is None:
             return False
 
-    async def close_shade(self, shade_id: int) -> bool:
-        """Close a shade."""
+        shade = self._shades.get(shade_id)
+        if shade is not None:
+            position = _to_ha_position(raw_position)
+            if shade.position != position:
+                shade.position = position
+                self._positions[shade_id] = position
+                self._changed_ids.add(shade_id)
+                self.async_update_listeners()
+        return True
+
+    async def _safe_api_call(
+        self,
+        coro_factory: Callable[[], Awaitable[bool]],
+        *,
+        action: str,
+        shade_id: int,
+    ) -> bool:
+        """Run a shade command, classifying and logging API errors in one place."""
         if not self.has_shade(shade_id):
             _LOGGER.error("Shade %s not found", shade_id)
             return False
 
-        try:
-            result = await self.api.close_shade(shade_id)
-
-            # Update local state immediately on success
-            if result and shade_id in self._shades:
-                self._shades[shade_id]["position"] = HA_CLOSED_VALUE
-                self.async_set_updated_data({"shades": self._shades})
-                _LOGGER.debug("Successfully closed shade %s", shade_id)
+        # Shades are about to move; poll at the normal rate again
+        self._last_command_time = self.hass.loop.time()
+        self._reset_interval()
 
-            # Schedule refresh to get the latest state
-            await self.async_request_refresh()
-            return result
-        except ApiConnectionError as err:
-            _LOGGER.error("Connection error closing shade %s: %s", shade_id, err)
-            return False
-        except ApiTimeoutError as err:
-            _LOGGER.error("Timeout closing shade %s: %s", shade_id, err)
+        try:
+            result = await coro_factory()
+        except (ApiConnectionError, ApiTimeoutError) as err:
+            self._log_command_error(
+                "%s %s shade %s: %s", _error_kind(err), action, shade_id, err
+            )
             return False
         except ApiAuthError as err:
-            _LOGGER.error("Authentication error closing shade %s: %s", shade_id, err)
-            # Trigger a full refresh to re-authenticate
-            self.async_set_updated_data(None)
-            await self.async_request_refresh()
+            self._log_command_error(
+                "Authentication error %s shade %s: %s", action, shade_id, err
+            )
+            # Trigger a full refresh to re-authenticate without holding up
+            # the command's return; debounced so a failed batch, whose
+            # waiters all share this error, refreshes only once
+            self.async_request_refresh_debounced()
             return False
-        except Exception as err:
-            _LOGGER.error("Error closing shade %s: %s", shade_id, err)
+        except (ApiError, asyncio.TimeoutError) as err:
+            # Anything else is a bug and propagates instead of reading as a
+            # failed command
+            self._log_command_error("Error %s shade %s: %s", action, shade_id, err)
             return False
 
+        # The periodic poll reconciles drift; refresh right away only if asked
+        # to and the next scheduled poll is not about to run anyway
+        if self._refresh_after_command and not self._poll_due_soon():
+            self.async_request_refresh_debounced()
+        return result
+
+    async def open_shade(self, shade_id: int) -> bool:
+        """Open a shade."""
+        # Local state is updated by the batch path on success
+        result = await self._safe_api_call(
+            lambda: self._async_set_single(shade_id, HA_OPEN_VALUE),
+            action="opening",
+            shade_id=shade_id,
+        )
+        if result and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully opened shade %s", shade_id)
+        return result
+
+    async def close_shade(self, shade_id: int) -> bool:
+        """Close a shade."""
+        # Local state is updated by the batch path on success
+        result = await self._safe_api_call(
+            lambda: self._async_set_single(shade_id, HA_CLOSED_VALUE),
+            action="closing",
+            shade_id=shade_id,
+        )
+        if result and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully closed shade %s", shade_id)
+        return result
+
     async def set_shade_position(self, shade_id: int, position: int) -> bool:
         """Set shade position."""
-        if not self.has_shade(shade_id):
-            _LOGGER.error("Shade %s not found", shade_id)
-            return False
-
-        try:
-            # Convert from Home Assistant position (0-100) to Crestron position (0-65535)
-            crestron_position = convert_position_from_ha(position)
-            result = await self.api.set_position(shade_id, crestron_position)
-
-            # Update local state immediately on success
-            if result and shade_id in self._shades:
-                self._shades[shade_id]["position"] = position
-                self.async_set_updated_data({"shades": self._shades})
-                _LOGGER.debug("Successfully set position for shade %s to %s", shade_id, position)
-
-            # Schedule refresh to get the latest state
-            await self.async_request_refresh()
-            return result
-        except ApiConnectionError as err:
-            _LOGGER.error("Connection error setting position for shade %s: %s", shade_id, err)
-            return False
-        except ApiTimeoutError as err:
-            _LOGGER.error("Timeout setting position for shade %s: %s", shade_id, err)
-            return False
-        except ApiAuthError as err:
-            _LOGGER.error("Authentication error setting position for shade %s: %s", shade_id, err)
-            # Trigger a full refresh to re-authenticate
-            self.async_set_updated_data(None)
-            await self.async_request_refresh()
-            return False
-        except Exception as err:
-            _LOGGER.error("Error setting position for shade %s: %s", shade_id, err)
-            return False
+        # Local state is updated by the batch path on success
+        result = await self._safe_api_call(
+            lambda: self._async_set_single(shade_id, position),
+            action="setting position for",
+            shade_id=shade_id,
+        )
+        if result and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully set position for shade %s to %s", shade_id, position)
+        return result
 
     async def stop_shade(self, shade_id: int) -> bool:
         """Stop a shade."""
-        if not self.has_shade(shade_id):
-            _LOGGER.error("Shade %s not found", shade_id)
-            return False
-
-        try:
-            result = await self.api.stop_shade(shade_id)
-
-            # Update UI immediately to indicate the shade has stopped
-            if result and shade_id in self._shades:
-                self.async_set_updated_data({"shades": self._shades})
-                _LOGGER.debug("Successfully stopped shade %s", shade_id)
-
-            # Schedule refresh to get the latest state
-            await self.async_request_refresh()
-            return result
-        except ApiConnectionError as err:
-            _LOGGER.error("Connection error stopping shade %s: %s", shade_id, err)
-            return False
-        except ApiTimeoutError as err:
-            _LOGGER.error("Timeout stopping shade %s: %s", shade_id, err)
-            return False
-        except ApiAuthError as err:
-            _LOGGER.error("Authentication error stopping shade %s: %s", shade_id, err)
-            # Trigger a full refresh to re-authenticate
-            self.async_set_updated_data(None)
-            await self.async_request_refresh()
-            return False
-        except Exception as err:
-            _LOGGER.error("Error stopping shade %s: %s", shade_id, err)
-            return False
+        result = await self._safe_api_call(
+            lambda: self._async_stop(shade_id),
+            action="stopping",
+            shade_id=shade_id,
+        )
+        if result and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Successfully stopped shade %s", shade_id)
+        return result
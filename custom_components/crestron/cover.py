@@ -1,7 +1,9 @@
 """Cover platform for Crestron integration."""
 from __future__ import annotations
 
+from functools import cached_property
 import logging
+import os
 from typing import Any
 
 from homeassistant.components.cover import (
@@ -16,12 +18,58 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import CONF_HOST, CONF_PORT, DOMAIN, MANUFACTURER
-from .coordinator import CrestronCoordinator
+from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
+
+from .api import HA_CLOSED_VALUE, HA_OPEN_VALUE
+from .const import (
+    CONF_HOST,
+    CONF_HUB_ID,
+    CONF_PORT,
+    DOMAIN,
+    MANUFACTURER,
+    host_unique_id,
+)
+from .coordinator import CrestronCoordinator, ShadeData
 
 _LOGGER = logging.getLogger(__name__)
 
+# Icon mapping, read in the executor on first setup
+ICONS_FILE = os.path.join(os.path.dirname(__file__), "icons.json")
+DATA_STATE_ICONS = f"{DOMAIN}_state_icons"
+DEFAULT_ICONS: dict[str, Any] = {
+    "shade": {
+        "default": "mdi:window-shutter",
+        "state": {
+            "open": "mdi:window-shutter-open",
+            "closed": "mdi:window-shutter",
+            "opening": "mdi:window-shutter-alert",
+            "closing": "mdi:window-shutter-alert",
+        },
+    }
+}
+
+
+def _load_icons(path: str) -> dict[str, Any]:
+    """Load the icon mapping, falling back to the defaults."""
+    try:
+        # Read raw bytes so the orjson-backed parser skips the str decode
+        with open(path, "rb") as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, *JSON_DECODE_EXCEPTIONS):
+        _LOGGER.warning("Could not load icons.json file")
+        return DEFAULT_ICONS
+
+
+def _build_state_icons(icons: dict[str, Any]) -> dict[str, str]:
+    """Flatten the icon mapping to state -> icon, using the default for gaps."""
+    shade_icons = icons.get("shade", {})
+    default = shade_icons.get("default", "mdi:window-shutter")
+    return {
+        state: shade_icons.get("state", {}).get(state, default)
+        for state in ("open", "closed", "partially_open")
+    }
+
+
 # Feature flags
 SUPPORT_CRESTRON_SHADE = (
     CoverEntityFeature.OPEN
@@ -37,6 +85,12 @@ async def async_setup_entry(
     """Set up Crestron cover devices."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
 
+    # Read icons.json off the event loop once and share it between entries
+    state_icons = hass.data.get(DATA_STATE_ICONS)
+    if state_icons is None:
+        icons = await hass.async_add_executor_job(_load_icons, ICONS_FILE)
+        state_icons = hass.data[DATA_STATE_ICONS] = _build_state_icons(icons)
+
     # Get the host from entry data
     host = entry.data[CONF_HOST]
 
@@ -44,32 +98,24 @@ async def async_setup_entry(
     port = entry.data.get(CONF_PORT, "")
 
     # Build a consistent hub identifier
-    hub_id = f"crestron_{host}"
+    hub_id = host_unique_id(host)
     if port:
-        hub_id = f"crestron_{host}:{port}"
+        hub_id = host_unique_id(f"{host}:{port}")
 
     # Create the hub device registry
     device_registry = dr.async_get(hass)
 
-    # Check for existing shades and look for what hub identifier they're using
-    existing_hub_id = None
-    for device in device_registry.devices.values():
-        # Check if this is one of our shades
-        if any(identifier[0] == DOMAIN and identifier[1].startswith("crestron_shade_")
-               for identifier in device.identifiers):
-            # Get its via_device reference
-            if device.via_device_id:
-                via_device = device_registry.async_get(device.via_device_id)
-                if via_device:
-                    existing_hub_id = next((identifier[1] for identifier in via_device.identifiers
-                                         if identifier[0] == DOMAIN), None)
-                    if existing_hub_id:
-                        _LOGGER.debug("Found existing hub device with ID: %s", existing_hub_id)
-                        break
-
-    # If no existing hub ID found, create one with consistent format
-    if not existing_hub_id:
-        existing_hub_id = hub_id
+    # The resolved hub identifier is stored on the entry after the first
+    # setup, so the device registry only has to be scanned once
+    existing_hub_id = entry.data.get(CONF_HUB_ID)
+    if existing_hub_id is None:
+        our_shade_ids = {f"crestron_shade_{shade_id}" for shade_id in coordinator.shades}
+        existing_hub_id = (
+            _find_existing_hub_id(device_registry, our_shade_ids) or hub_id
+        )
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_HUB_ID: existing_hub_id}
+        )
 
     # Create or update the hub device with the correct identifier
     hub_device = device_registry.async_get_or_create(
@@ -81,21 +127,40 @@ async def async_setup_entry(
     )
 
     # Get all shades from the coordinator
-    entities = []
-    for shade_id, shade_data in coordinator.shades.items():
-        entities.append(
-            CrestronShade(
-                coordinator,
-                shade_id,
-                shade_data,
-                existing_hub_id  # Using the existing ID format
-            )
+    if not coordinator.shades:
+        _LOGGER.info("No shade entities found for Crestron integration")
+        return
+
+    async_add_entities(
+        CrestronShade(
+            coordinator,
+            shade_id,
+            shade_data,
+            existing_hub_id,  # Using the existing ID format
+            state_icons,
         )
+        for shade_id, shade_data in coordinator.shades.items()
+    )
 
-    if entities:
-        async_add_entities(entities)
-    else:
-        _LOGGER.info("No shade entities found for Crestron integration")
+
+def _find_existing_hub_id(
+    device_registry: dr.DeviceRegistry, our_shade_ids: set[str]
+) -> str | None:
+    """Return the hub identifier already used by registered shades, if any."""
+    for device in device_registry.devices.values():
+        # Check if this is one of our shades
+        if any(identifier[0] == DOMAIN and identifier[1] in our_shade_ids
+               for identifier in device.identifiers):
+            # Get its via_device reference
+            if device.via_device_id:
+                via_device = device_registry.async_get(device.via_device_id)
+                if via_device:
+                    existing_hub_id = next((identifier[1] for identifier in via_device.identifiers
+                                         if identifier[0] == DOMAIN), None)
+                    if existing_hub_id:
+                        _LOGGER.debug("Found existing hub device with ID: %s", existing_hub_id)
+                        return existing_hub_id
+    return None
 
 
 class CrestronShade(CoordinatorEntity, CoverEntity):
@@ -109,63 +174,89 @@ class CrestronShade(CoordinatorEntity, CoverEntity):
         self,
         coordinator: CrestronCoordinator,
         shade_id: int,
-        shade_data: dict[str, Any],
+        shade_data: ShadeData,
         hub_device_id: str,
+        state_icons: dict[str, str],
     ) -> None:
         """Initialize the shade."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=shade_id)
 
         # Store shade details
         self._shade_id = shade_id
-        self._shade_data = shade_data
         self._hub_device_id = hub_device_id
+        self._state_icons = state_icons
 
         # Set entity attributes
         self._attr_unique_id = f"crestron_shade_{shade_id}"
-        self._attr_name = shade_data.get("name", f"Shade {shade_id}")
+        self._attr_name = shade_data.name or f"Shade {shade_id}"
+
+        # Motion is not reported by the controller, so these never change
+        self._attr_is_opening = False
+        self._attr_is_closing = False
+
+        # Cover state, refreshed from the coordinator before each write
+        self._store_position(shade_data.position)
+
+        # Last written values, used to skip redundant state writes
+        self._last_available: bool | None = None
+        # assumed_state follows the coordinator's last update result
+        self._last_update_success: bool | None = None
+        self._last_connection_status: str | None = shade_data.connection_status
 
-        # Set up device info with the correct hub identifier
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"crestron_shade_{shade_id}")},
+    @cached_property
+    def device_info(self) -> DeviceInfo:
+        """Return device info, built on first access."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self._attr_unique_id)},
             manufacturer=MANUFACTURER,
             model="Crestron Shade",
             name=self._attr_name,
             via_device=(DOMAIN, self._hub_device_id),
         )
 
-        # Update state
-        self._update_attributes()
-
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
-        if self._shade_id in self.coordinator.shades:
-            self._shade_data = self.coordinator.shades[self._shade_id]
-            self._update_attributes()
+        # Skip the state write when neither this shade nor its availability
+        # or assumed state changed
+        available = self.available
+        update_success = self.coordinator.last_update_success
+        if (
+            self._shade_id not in self.coordinator.changed_ids
+            and available == self._last_available
+            and update_success == self._last_update_success
+        ):
+            return
+
+        position = self.coordinator.get_position(self._shade_id)
+        status = self.coordinator.get_connection_status(self._shade_id)
+        if (
+            position is not None
+            and available == self._last_available
+            and update_success == self._last_update_success
+            and position == self._attr_current_cover_position
+            and status == self._last_connection_status
+        ):
+            return
+        self._last_available = available
+        self._last_update_success = update_success
+        self._store_position(position)
+        self._last_connection_status = status
         self.async_write_ha_state()
 
-    def _update_attributes(self) -> None:
-        """Update entity attributes based on coordinator data."""
-        # Position is from 0 (closed) to 100 (open)
-        position = self._shade_data.get("position", 0)
-
-        # Convert percentage position to HA's scale (0-100)
-        self._attr_current_position = position
-
-        # Determine if the shade is open, closed, or in between
-        self._attr_is_closed = position == 0
-        self._attr_is_opening = False
-        self._attr_is_closing = False
-
-    @property
-    def state(self) -> str:
-        """Return the state of the cover."""
-        if self._attr_is_closed:
-            return "closed"
-        elif self._attr_current_position == 100:
-            return "open"
+    def _store_position(self, position: int | None) -> None:
+        """Store the position (0 closed - 100 open) and derived state."""
+        self._attr_current_cover_position = position
+        # A shade without a position is gone and reported unavailable anyway
+        self._attr_is_closed = position == HA_CLOSED_VALUE
+        # Pick the icon here so state writes don't repeat the lookup
+        if not position:
+            state = "closed"
+        elif position == HA_OPEN_VALUE:
+            state = "open"
         else:
-            return "partially_open"
+            state = "partially_open"
+        self._attr_icon = self._state_icons[state]
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
@@ -191,6 +282,11 @@ class CrestronShade(CoordinatorEntity, CoverEntity):
     async def async_set_cover_position(self, **kwargs: Any) -> None:
         """Move the cover to a specific position."""
         if ATTR_POSITION in kwargs:
+            # Only skip when a fresh poll confirms the shade is already there
+            if self.coordinator.is_confirmed_at(
+                self._shade_id, kwargs[ATTR_POSITION]
+            ):
+                return
             success = await self.coordinator.set_shade_position(
                 self._shade_id, kwargs[ATTR_POSITION]
             )
@@ -202,8 +298,10 @@ class CrestronShade(CoordinatorEntity, CoverEntity):
     def available(self) -> bool:
         """Return if entity is available."""
         # Entity is available if we have shade data and coordinator is connected
-        shade_data = self.coordinator.shades.get(self._shade_id)
-        return shade_data is not None and self.coordinator.is_connected
+        return (
+            self.coordinator.get_connection_status(self._shade_id) is not None
+            and self.coordinator.is_connected
+        )
 
     @property
     def assumed_state(self) -> bool:
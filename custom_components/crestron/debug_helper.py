@@ -1,65 +1,51 @@
 """Debug helper for Crestron integration."""
 import logging
 import importlib
-import sys
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def check_repairs_module():
-    """Check what functions are available in the repairs module."""
+def _check_module(name, items):
+    """Import a module by name and report which of the given items it has."""
     try:
-        from homeassistant.components import repairs
-        module_info = {
-            "name": "homeassistant.components.repairs",
-            "exists": True,
-            "dir": dir(repairs),
+        module = importlib.import_module(name)
+    except ImportError:
+        return {
+            "name": name,
+            "exists": False,
+            "error": "Module not found"
         }
 
-        # Check for specific functions
-        for func_name in [
+    module_info = {
+        "name": name,
+        "exists": True,
+        "dir": dir(module),
+    }
+    for item in items:
+        module_info[item] = hasattr(module, item)
+    return module_info
+
+
+def check_repairs_module():
+    """Check what functions are available in the repairs module."""
+    return _check_module(
+        "homeassistant.components.repairs",
+        (
             "RepairsFlow",
             "async_create_fix_flow",
             "async_register_issue",
             "async_delete_issue",
             "ISSUE_REGISTRY",
-        ]:
-            module_info[func_name] = hasattr(repairs, func_name)
-
-        return module_info
-    except ImportError:
-        return {
-            "name": "homeassistant.components.repairs",
-            "exists": False,
-            "error": "Module not found"
-        }
+        ),
+    )
 
 
 def check_issue_registry():
     """Check what functions are available in the issue registry."""
-    try:
-        from homeassistant.helpers import issue_registry
-        module_info = {
-            "name": "homeassistant.helpers.issue_registry",
-            "exists": True,
-            "dir": dir(issue_registry),
-        }
-
-        # Check for specific classes and functions
-        for item in [
-            "IssueRegistry",
-            "IssueSeverity",
-            "async_get",
-        ]:
-            module_info[item] = hasattr(issue_registry, item)
-
-        return module_info
-    except ImportError:
-        return {
-            "name": "homeassistant.helpers.issue_registry",
-            "exists": False,
-            "error": "Module not found"
-        }
+    return _check_module(
+        "homeassistant.helpers.issue_registry",
+        ("IssueRegistry", "IssueSeverity", "async_get"),
+    )
 
 
 def check_config_flow():
@@ -4,16 +4,20 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.loader import async_get_integration
 
-from .const import CONF_AUTH_TOKEN, DOMAIN
+from .const import CONF_AUTH_TOKEN, CONF_HOST, CONF_HUB_ID, DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-TO_REDACT = [CONF_AUTH_TOKEN]
+TO_REDACT: frozenset[str] = frozenset({CONF_AUTH_TOKEN, CONF_HOST, CONF_HUB_ID})
+
+# Per-shade data is left out of diagnostics for very large installations
+MAX_DIAGNOSTIC_SHADES = 1000
 
 
 async def async_get_config_entry_diagnostics(
@@ -33,29 +37,38 @@ async def async_get_config_entry_diagnostics(
     # Get all entities for this entry
     entities = er.async_entries_for_config_entry(entity_registry, entry.entry_id)
 
+    # The title, unique ID and hub device name all embed the host
+    host = entry.data.get(CONF_HOST)
+
+    def _mask_host(value: str | None) -> str | None:
+        """Replace the controller host inside a string."""
+        if value and host:
+            return value.replace(host, REDACTED)
+        return value
+
     # Collect configuration data
     config_data = {
         "entry": {
             "entry_id": entry.entry_id,
             "version": entry.version,
             "domain": entry.domain,
-            "title": entry.title,
+            "title": _mask_host(entry.title),
             "data": async_redact_data(dict(entry.data), TO_REDACT),
             "options": async_redact_data(dict(entry.options), TO_REDACT),
             "source": entry.source,
-            "unique_id": entry.unique_id,
+            "unique_id": _mask_host(entry.unique_id),
         },
-        "devices": [
+        "devices": tuple(
             {
                 "id": device.id,
-                "name": device.name,
+                "name": _mask_host(device.name),
                 "manufacturer": device.manufacturer,
                 "model": device.model,
                 "disabled": device.disabled,
             }
             for device in devices
-        ],
-        "entities": [
+        ),
+        "entities": tuple(
             {
                 "id": entity.entity_id,
                 "name": entity.name,
@@ -65,20 +78,29 @@ async def async_get_config_entry_diagnostics(
                 "unique_id": entity.unique_id,
             }
             for entity in entities
-        ],
+        ),
     }
 
     # If coordinator exists, get basic data
     if coordinator:
         try:
+            shades = coordinator.shades
             config_data["coordinator"] = {
                 "last_update_success": coordinator.last_update_success,
-                "shades_count": len(coordinator.shades) if hasattr(coordinator, "shades") else 0,
+                "shades_count": len(shades),
             }
+            if len(shades) < MAX_DIAGNOSTIC_SHADES:
+                config_data["coordinator"]["shades"] = tuple(
+                    shade.to_dict() for shade in shades.values()
+                )
         except Exception as ex:
             config_data["coordinator_error"] = str(ex)
 
     # Add integration domain for debugging
     config_data["integration_domain"] = DOMAIN
 
+    # The loader keeps parsed manifests in memory, so no file is read here
+    integration = await async_get_integration(hass, DOMAIN)
+    config_data["manifest"] = integration.manifest
+
     return config_data
\ No newline at end of file
@@ -1,14 +1,12 @@
 """Repair functions for the Crestron integration."""
 from __future__ import annotations
 
-from typing import Any, Dict, Final
+from typing import Dict, Final
 import logging
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN
-
 _LOGGER = logging.getLogger(__name__)
 
 # Issue IDs
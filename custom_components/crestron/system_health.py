@@ -3,11 +3,11 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-import aiohttp
 from homeassistant.components.system_health import SystemHealthRegistration
 from homeassistant.core import HomeAssistant, callback
 
-from .const import DOMAIN, _LOGGER
+from .const import DOMAIN
+from .coordinator import CrestronCoordinator
 
 
 @callback
@@ -18,25 +18,22 @@ def async_register(hass: HomeAssistant, register: SystemHealthRegistration) -> N
 
 async def system_health_info(hass: HomeAssistant) -> Dict[str, Any]:
     """Get info for the system health info."""
-    integrations = [
-        entry
+    # Count configured hosts and active connections
+    configured_hosts = sum(
+        1
         for entry in hass.config_entries.async_entries(DOMAIN)
         if entry.state.recoverable
+    )
+    # Check all hosts for active connections; the rest failed their last update
+    coordinators = [
+        coordinator
+        for coordinator in hass.data.get(DOMAIN, {}).values()
+        if isinstance(coordinator, CrestronCoordinator)
     ]
-
-    # Count configured hosts and active connections
-    configured_hosts = len(integrations)
-    active_connections = 0
-    api_error_count = 0
-
-    # Check all hosts for active connections
-    if DOMAIN in hass.data:
-        for entry_id, coordinator in hass.data[DOMAIN].items():
-            try:
-                if coordinator.last_update_success:
-                    active_connections += 1
-            except Exception:  # pylint: disable=broad-except
-                api_error_count += 1
+    active_connections = sum(
+        1 for coordinator in coordinators if coordinator.last_update_success
+    )
+    api_error_count = len(coordinators) - active_connections
 
     return {
         "configured_hosts": configured_hosts,